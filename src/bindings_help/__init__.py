@@ -1,6 +1,6 @@
 """Config-driven parser for keybindings."""
 
-from .parser import parse_file, parse_all, load_config
+from .parser import parse_file, parse_all, iter_bindings, load_config
 
-__all__ = ["parse_file", "parse_all", "load_config"]
+__all__ = ["parse_file", "parse_all", "iter_bindings", "load_config"]
 __version__ = "0.1.0"
@@ -7,14 +7,17 @@ import os
 import signal
 import subprocess
 import sys
+import unicodedata
+from itertools import islice
 from pathlib import Path
+from typing import Iterable
 
 # Handle broken pipe (e.g., confhelp | head) gracefully
 signal.signal(signal.SIGPIPE, signal.SIG_DFL)
 
 from iterfzf import iterfzf
 
-from .parser import find_conflicts, parse_all
+from .parser import find_conflicts, iter_bindings, parse_all, prune_cache
 
 def get_default_config_paths() -> list[Path]:
     paths = []
@@ -26,6 +29,12 @@ def get_default_config_paths() -> list[Path]:
     return paths
 
 
+def get_default_cache_dir() -> Path:
+    xdg_cache = os.environ.get("XDG_CACHE_HOME")
+    base = Path(xdg_cache) if xdg_cache else Path.home() / ".cache"
+    return base / "confhelp/parse"
+
+
 def find_config() -> Path | None:
     for p in get_default_config_paths():
         if p.exists():
@@ -67,6 +76,68 @@ desc_from_comment = true
 '''
 
 
+def write_lines(lines: Iterable[str], chunk_size: int = 1000) -> None:
+    """Write lines to stdout in joined chunks instead of one print() per line."""
+    lines = iter(lines)
+    while chunk := list(islice(lines, chunk_size)):
+        sys.stdout.write("\n".join(chunk) + "\n")
+
+
+def dump_json(data: list[dict]) -> bytes:
+    """Encode data as indented UTF-8 JSON, using orjson when installed."""
+    try:
+        import orjson
+    except ImportError:
+        import json
+        return json.dumps(data, indent=2, ensure_ascii=False).encode()
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+
+def _display_width(text: str) -> int:
+    """Get the terminal columns text takes: wide chars 2, combining marks 0."""
+    if text.isascii():
+        return len(text)
+    width = 0
+    for ch in text:
+        if unicodedata.east_asian_width(ch) in ("W", "F"):
+            width += 2
+        elif not unicodedata.combining(ch):
+            width += 1
+    return width
+
+
+def align_columns(lines: list[str], sep: str = "|") -> list[str]:
+    """Pad sep-delimited fields into aligned columns, like `column -t -s<sep>`.
+
+    Rows may have different field counts (e.g. a desc containing sep).
+    The last field of each row is left unpadded. Widths are display widths,
+    so CJK and emoji descs line up in a terminal.
+    """
+    rows = [line.split(sep) for line in lines]
+    row_widths = [[_display_width(cell) for cell in row] for row in rows]
+    widths: list[int] = []
+    for cell_widths in row_widths:
+        for i, width in enumerate(cell_widths):
+            if i == len(widths):
+                widths.append(width)
+            elif width > widths[i]:
+                widths[i] = width
+    return [
+        "  ".join([c + " " * (w - cw) for c, cw, w in zip(row[:-1], cell_widths, widths)]
+                  + row[-1:])
+        for row, cell_widths in zip(rows, row_widths)
+    ]
+
+
+def fzf_entries(lines: list[str]) -> list[str]:
+    """Align lines for fzf, prefixed with their index and a tab.
+
+    fzf hides the index (--with-nth=2..) and returns it with the selection,
+    so the chosen binding is looked up directly rather than re-parsed.
+    """
+    return [f"{i}\t{line}" for i, line in enumerate(align_columns(lines))]
+
+
 def init_config() -> None:
     config_dir = Path.home() / ".config/confhelp"
     config_file = config_dir / "config.toml"
@@ -102,6 +173,8 @@ def main():
                        help="Report lines that look like bindings but failed to parse")
     parser.add_argument("--conflicts", action="store_true",
                        help="Show keys defined more than once")
+    parser.add_argument("--no-cache", action="store_true",
+                       help="Re-parse every file instead of reusing cached results")
     args = parser.parse_args()
 
     if args.init:
@@ -130,11 +203,27 @@ def main():
         print("Run 'confhelp --init' to create a sample config.", file=sys.stderr)
         sys.exit(1)
 
+    cache_dir = None if args.no_cache else get_default_cache_dir()
+    if cache_dir:
+        prune_cache(cache_dir)
+
+    # Text output streams while parsing, so e.g. `| head` stops early
+    needs_all = args.check or args.conflicts or args.select or args.edit
+    if not needs_all and args.format != "json":
+        streamed = (b for base_dir in args.base_dirs
+                    for b in iter_bindings(args.config, base_dir, cache_dir=cache_dir))
+        if args.format == "tsv":
+            write_lines(f"{b.type}\t{b.key}\t{b.desc}\t{b.file}:{b.line}" for b in streamed)
+        else:
+            write_lines(b.to_line() for b in streamed)
+        return
+
     # Parse all base directories
     all_bindings = []
     all_missed = []
     for base_dir in args.base_dirs:
-        bindings, missed = parse_all(args.config, base_dir, collect_missed=args.check)
+        bindings, missed = parse_all(args.config, base_dir, collect_missed=args.check,
+                                     cache_dir=cache_dir)
         # Store base_dir with each binding for path resolution
         for b in bindings:
             b._base_dir = base_dir
@@ -171,40 +260,29 @@ def main():
 
     # Interactive mode
     if args.select or args.edit:
-        lines = [b.to_line() for b in all_bindings]
-        # Format with column for alignment
-        proc = subprocess.run(["column", "-t", "-s|"], input="\n".join(lines),
-                             capture_output=True, text=True)
-        formatted = proc.stdout.strip().split("\n")
+        entries = fzf_entries([b.to_line() for b in all_bindings])
 
         try:
             selection = iterfzf(
-                formatted,
+                entries,
                 exact=True,
                 bind={
                     "ctrl-p": "half-page-up",
                     "ctrl-n": "half-page-down",
                     "page-up": "half-page-up",
                     "page-down": "half-page-down",
-                }
+                },
+                # Hide the leading index field from display and matching
+                __extra__=["--delimiter=\t", "--with-nth=2.."],
             )
         except KeyboardInterrupt:
             sys.exit(130)
         if not selection:
             sys.exit(1)
 
-        # Extract file:line from last column
-        file_line = selection.split()[-1]
-        fname, line = file_line.rsplit(":", 1)
-
-        # Find the matching binding to get its base_dir
-        for b in all_bindings:
-            if b.file == fname and str(b.line) == line:
-                path = b._base_dir / fname
-                break
-        else:
-            # Fallback to first base_dir
-            path = args.base_dirs[0] / fname
+        b = all_bindings[int(selection.split("\t", 1)[0])]
+        path = b._base_dir / b.file
+        line = b.line
 
         if args.edit:
             editor = os.environ.get("EDITOR", "vim")
@@ -215,18 +293,10 @@ def main():
 
     bindings = all_bindings
 
-    # Output mode
-    if args.format == "json":
-        import json
-        data = [{"type": b.type, "key": b.key, "desc": b.desc,
-                 "file": b.file, "line": b.line} for b in bindings]
-        print(json.dumps(data, indent=2))
-    elif args.format == "tsv":
-        for b in bindings:
-            print(f"{b.type}\t{b.key}\t{b.desc}\t{b.file}:{b.line}")
-    else:
-        for b in bindings:
-            print(b.to_line())
+    # JSON output needs the full list
+    data = [{"type": b.type, "key": b.key, "desc": b.desc,
+             "file": b.file, "line": b.line} for b in bindings]
+    sys.stdout.buffer.write(dump_json(data) + b"\n")
 
 
 if __name__ == "__main__":
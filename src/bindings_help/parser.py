@@ -1,9 +1,17 @@
 """Config-driven parser for extracting bindings from config files."""
 
+import hashlib
+import json
+import os
 import re
 import shutil
 import subprocess
 import sys
+import tempfile
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass
 
 if sys.version_info >= (3, 11):
@@ -11,12 +19,48 @@ if sys.version_info >= (3, 11):
 else:
     import tomli as tomllib
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Iterator, Optional
+
+# Fallback desc for desc_from_comment bindings without a trailing comment
+_FUNC_MATCH = re.compile(r"['\"][^'\"]+['\"]\s+(\S+)")
+# desc = "..." or desc = '...' in nvim lua configs, one alternative per
+# quote type to handle apostrophes in strings. Scanned over whole files,
+# so no part of the match may cross a newline.
+_DESC = re.compile(r"""desc[^\S\n]*=[^\S\n]*(?:"([^"\n]+)"|'([^'\n]+)')""")
+
+# Printed as lhs|desc by headless nvim for query_nvim_keymaps
+_NVIM_KEYMAP_LUA = r'''
+local leader = vim.g.mapleader or "\\"
+for _, mode in ipairs({"n", "v", "i", "x"}) do
+  for _, m in ipairs(vim.api.nvim_get_keymap(mode)) do
+    if m.desc then
+      local lhs = m.lhs
+      if lhs:sub(1, #leader) == leader then
+        lhs = "<leader>" .. lhs:sub(#leader + 1)
+      end
+      print(string.format("%s|%s", lhs, m.desc))
+    end
+  end
+end
+'''
+
+# Bump when the cached result layout or key changes
+_CACHE_VERSION = 2
+# prune_cache bounds: entries older than this are dropped, then the oldest
+# beyond the count limit
+_CACHE_MAX_AGE = 30 * 24 * 3600
+_CACHE_MAX_ENTRIES = 2048
+
+# Total input size before parse_all spreads files over worker processes
+_PARALLEL_MIN_BYTES = 4 * 1024 * 1024
 
 
 @dataclass
 class Binding:
     """A parsed binding entry."""
+    # No per-instance __dict__; _base_dir is set by the CLI when merging base dirs
+    __slots__ = ("type", "key", "desc", "file", "line", "_base_dir")
+
     type: str
     key: str
     desc: str
@@ -30,6 +74,8 @@ class Binding:
 @dataclass
 class MissedLine:
     """A line that matched match_line but failed regex."""
+    __slots__ = ("file", "line", "content", "parser_name", "_base_dir")
+
     file: str
     line: int
     content: str
@@ -42,29 +88,128 @@ def load_config(config_path: Path) -> dict:
         return tomllib.load(f)
 
 
+class _DescIndex:
+    """desc -> (file, line) lookup stored as parallel arrays.
+
+    Costs a dict slot plus one array entry per desc instead of a tuple and
+    int object each; file names are shared between descs from the same file.
+    Adding an existing desc overwrites its location.
+    """
+
+    __slots__ = ("files", "lines", "index")
+
+    def __init__(self) -> None:
+        self.files: list[str] = []
+        self.lines = array("i")
+        self.index: dict[str, int] = {}
+
+    def add(self, desc: str, file: str, line: int) -> None:
+        i = self.index.get(desc)
+        if i is None:
+            self.index[desc] = len(self.files)
+            self.files.append(file)
+            self.lines.append(line)
+        else:
+            self.files[i] = file
+            self.lines[i] = line
+
+    def get(self, desc: str) -> Optional[tuple[str, int]]:
+        i = self.index.get(desc)
+        if i is None:
+            return None
+        return self.files[i], self.lines[i]
+
+    def __len__(self) -> int:
+        return len(self.files)
+
+
+def _index_lua_descs(nvim_dir: Path, base_dir: Path) -> _DescIndex:
+    """Map each desc string in nvim lua files to its (file, line).
+
+    Uses ripgrep when available and falls back to scanning in Python.
+    Only the first desc on a line is used; for duplicate descs the last
+    file (in path order) and line wins.
+    """
+    if shutil.which("rg"):
+        index = _rg_lua_descs(nvim_dir, base_dir)
+        if index is not None:
+            return index
+    return _scan_lua_descs(nvim_dir, base_dir)
+
+
+def _rg_lua_descs(nvim_dir: Path, base_dir: Path) -> Optional[_DescIndex]:
+    """Build the desc index with one ripgrep run. Returns None if rg fails."""
+    try:
+        result = subprocess.run(
+            [
+                # --no-ignore/--hidden: scan the same files as the rglob fallback
+                "rg", "--no-config", "--no-ignore", "--hidden",
+                "--no-heading", "--with-filename", "--line-number",
+                "--null", "--color", "never", "--only-matching", "--replace", "$1$2",
+                "--glob", "*.lua", "-e", _DESC.pattern, "--", str(nvim_dir),
+            ],
+            capture_output=True,
+            text=True,
+            errors="replace",
+            timeout=10,
+        )
+    except (subprocess.TimeoutExpired, OSError):
+        return None
+    # 1 means no matches; anything else is an error
+    if result.returncode not in (0, 1):
+        return None
+
+    # Output is path\0line:desc, one line per match; rg walks files in
+    # parallel, so sort to resolve duplicates deterministically
+    hits = []
+    for line in result.stdout.splitlines():
+        path, _, rest = line.partition("\0")
+        line_num, _, desc = rest.partition(":")
+        if desc and line_num.isdigit():
+            hits.append((Path(path), int(line_num), desc))
+    hits.sort(key=lambda hit: (hit[0], hit[1]))
+
+    index = _DescIndex()
+    last_path, last_line, src = None, 0, ""
+    for path, line_num, desc in hits:
+        if path != last_path:
+            src = str(path.relative_to(base_dir))
+        elif line_num == last_line:
+            continue
+        last_path, last_line = path, line_num
+        index.add(desc, src, line_num)
+    return index
+
+
+def _scan_lua_descs(nvim_dir: Path, base_dir: Path) -> _DescIndex:
+    """Build the desc index by scanning each lua file with one pass of _DESC."""
+    index = _DescIndex()
+    for lua_path in sorted(nvim_dir.rglob("*.lua")):
+        try:
+            # Undecodable bytes are replaced, as in the rg output
+            content = lua_path.read_text(errors="replace")
+        except OSError:
+            continue
+        src = str(lua_path.relative_to(base_dir))
+        line_num, last_pos, last_line = 1, 0, 0
+        for m in _DESC.finditer(content):
+            line_num += content.count("\n", last_pos, m.start())
+            last_pos = m.start()
+            if line_num == last_line:
+                continue
+            last_line = line_num
+            index.add(m.group(1) or m.group(2), src, line_num)
+    return index
+
+
 def query_nvim_keymaps(cfg: dict, base_dir: Optional[Path] = None) -> list[Binding]:
     """Query nvim for keymaps via headless execution."""
     if not shutil.which("nvim"):
         return []
 
-    import tempfile
-    lua_script = r'''
-local leader = vim.g.mapleader or "\\"
-for _, mode in ipairs({"n", "v", "i", "x"}) do
-  for _, m in ipairs(vim.api.nvim_get_keymap(mode)) do
-    if m.desc then
-      local lhs = m.lhs
-      if lhs:sub(1, #leader) == leader then
-        lhs = "<leader>" .. lhs:sub(#leader + 1)
-      end
-      print(string.format("%s|%s", lhs, m.desc))
-    end
-  end
-end
-'''
     try:
         with tempfile.NamedTemporaryFile(mode="w", suffix=".lua", delete=False) as f:
-            f.write(lua_script)
+            f.write(_NVIM_KEYMAP_LUA)
             lua_file = f.name
         result = subprocess.run(
             ["nvim", "--headless", "-c", f"luafile {lua_file}", "-c", "q"],
@@ -77,25 +222,11 @@ end
         return []
 
     # Build desc->location index by grepping nvim config files
-    desc_locations: dict[str, tuple[str, int]] = {}
+    desc_locations = _DescIndex()
     if base_dir:
         nvim_dir = base_dir / ".config/nvim"
         if nvim_dir.exists():
-            for lua_path in nvim_dir.rglob("*.lua"):
-                try:
-                    for i, line in enumerate(lua_path.read_text().splitlines(), 1):
-                        # Look for desc = "..." or desc = '...' patterns
-                        # Match quote type separately to handle apostrophes in strings
-                        match = re.search(r'desc\s*=\s*"([^"]+)"', line)
-                        if not match:
-                            match = re.search(r"desc\s*=\s*'([^']+)'", line)
-                        if match:
-                            desc_locations[match.group(1)] = (
-                                str(lua_path.relative_to(base_dir)),
-                                i,
-                            )
-                except (OSError, UnicodeDecodeError):
-                    continue
+            desc_locations = _index_lua_descs(nvim_dir, base_dir)
 
     bindings = []
     truncate = cfg.get("truncate", 60)
@@ -107,18 +238,30 @@ end
         if len(parts) >= 2:
             key, desc = parts[0], parts[1]
             # Find source location from desc - skip plugin bindings without source
-            if desc not in desc_locations:
+            location = desc_locations.get(desc)
+            if location is None:
                 continue
-            src, line_num = desc_locations[desc]
+            src, line_num = location
             if truncate and len(desc) > truncate:
                 desc = desc[:truncate]
             bindings.append(Binding("nvim", key, desc, src, line_num))
     return bindings
 
 
-def _get_line_number(content: str, pos: int) -> int:
-    """Get 1-based line number for position in content."""
-    return content[:pos].count("\n") + 1
+def _compile_cfg(cfg: dict) -> dict:
+    """Return a copy of cfg with regex and match_line compiled.
+
+    Already compiled configs are returned unchanged, so parse_all can compile
+    each parser block once and share it across every file it matches.
+    """
+    if isinstance(cfg.get("regex"), re.Pattern):
+        return cfg
+    compiled = dict(cfg)
+    flags = re.DOTALL if cfg.get("multiline", False) else 0
+    compiled["regex"] = re.compile(cfg["regex"], flags)
+    match_line = cfg.get("match_line")
+    compiled["match_line"] = re.compile(match_line) if match_line else None
+    return compiled
 
 
 def _parse_file_multiline(
@@ -130,19 +273,22 @@ def _parse_file_multiline(
     content = path.read_text()
     fname = rel_path if rel_path else path.name
 
-    # Compile with DOTALL so . matches newlines
-    regex = re.compile(cfg["regex"], re.DOTALL)
+    # Compiled with DOTALL so . matches newlines
+    regex = _compile_cfg(cfg)["regex"]
+    btype = cfg["type"]
+    key_group = cfg.get("key_group", 1)
+    desc_group = cfg.get("desc_group")
+    source_group = cfg.get("source_group")
     truncate = cfg.get("truncate", 0)
     strip_quotes = cfg.get("strip_quotes", False)
 
+    # finditer yields matches in order, so line numbers are tracked by
+    # counting only the newlines between consecutive matches
+    line_num, last_pos = 1, 0
     results = []
     for m in regex.finditer(content):
-        key = m.group(cfg.get("key_group", 1))
-
-        if cfg.get("desc_group"):
-            desc = m.group(cfg["desc_group"]).strip()
-        else:
-            desc = ""
+        key = m.group(key_group)
+        desc = m.group(desc_group).strip() if desc_group else ""
 
         if strip_quotes:
             desc = desc.strip("'\"")
@@ -151,150 +297,425 @@ def _parse_file_multiline(
 
         # Use source_group to override file if present
         file_out = fname
-        if cfg.get("source_group"):
-            src = m.group(cfg["source_group"]).strip()
+        if source_group:
+            src = m.group(source_group).strip()
             if src:
                 file_out = src
 
-        line_num = _get_line_number(content, m.start())
-        results.append(Binding(cfg["type"], key, desc, file_out, line_num))
+        start = m.start()
+        line_num += content.count("\n", last_pos, start)
+        last_pos = start
+        results.append(Binding(btype, key, desc, file_out, line_num))
 
     return results
 
 
+def _parse_file_lines(
+    path: Path,
+    cfg: dict,
+    fname: str,
+    collect_missed: bool,
+    parser_name: str,
+) -> tuple[list[Binding], list[MissedLine]]:
+    """Parse file line by line."""
+    results = []
+    missed = []
+
+    match_line = cfg["match_line"]
+    # Specialize on the config once so the per-line loop only branches on
+    # what applies. Bound methods skip an attribute lookup per line.
+    search = cfg["regex"].search
+    prefilter = match_line.search if match_line else None
+    btype = cfg["type"]
+    key_group = cfg.get("key_group", 1)
+    desc_group = cfg.get("desc_group")
+    skip_comment = cfg.get("skip_comment", False)
+    truncate = cfg.get("truncate", 0)
+    strip_quotes = cfg.get("strip_quotes", False)
+    desc_from_comment = cfg.get("desc_from_comment", False)
+    desc_literal = cfg.get("desc_literal")
+
+    # Descriptions that don't depend on the line are finished up front
+    static_desc = None
+    if desc_literal or not (desc_from_comment or desc_group):
+        static_desc = desc_literal or ""
+        if strip_quotes:
+            static_desc = static_desc.strip("'\"")
+        if truncate and len(static_desc) > truncate:
+            static_desc = static_desc[:truncate]
+
+    # Stream lines rather than holding the whole file plus a list of lines.
+    # Splits on \n, \r\n and \r only, matching editor line numbers.
+    with open(path) as f:
+        for i, line in enumerate(f, 1):
+            stripped = line.strip()
+
+            if skip_comment and stripped.startswith("#"):
+                continue
+            if prefilter and not prefilter(stripped):
+                continue
+
+            m = search(stripped)
+            if not m:
+                if collect_missed:
+                    missed.append(MissedLine(fname, i, stripped, parser_name))
+                continue
+
+            key = m.group(key_group)
+
+            # Determine description
+            if static_desc is not None:
+                desc = static_desc
+            else:
+                if desc_from_comment:
+                    if "#" in line:
+                        desc = line.split("#", 1)[1].strip()
+                    else:
+                        func_match = _FUNC_MATCH.search(stripped)
+                        desc = func_match.group(1) if func_match else stripped[:40]
+                else:
+                    desc = m.group(desc_group).strip()
+
+                if strip_quotes:
+                    desc = desc.strip("'\"")
+                if truncate and len(desc) > truncate:
+                    desc = desc[:truncate]
+
+            results.append(Binding(btype, key, desc, fname, i))
+
+    return results, missed
+
+
+def _cache_file(
+    cache_dir: Path,
+    path: Path,
+    cfg: dict,
+    fname: str,
+    collect_missed: bool,
+    parser_name: str,
+) -> Path:
+    """Get cache entry path for parsing path with cfg.
+
+    The name covers everything that shapes the output except the file
+    contents, which are checked against the stored mtime/size on read.
+    A changed file overwrites its entry rather than adding a new one.
+    """
+    # Compiled patterns are keyed by their full source; str() truncates them
+    cfg_json = json.dumps(
+        cfg, sort_keys=True,
+        default=lambda o: o.pattern if isinstance(o, re.Pattern) else str(o),
+    )
+    key = f"{_CACHE_VERSION}|{path.resolve()}|{fname}|{collect_missed}|{parser_name}|{cfg_json}"
+    return cache_dir / f"{hashlib.blake2b(key.encode(), digest_size=16).hexdigest()}.json"
+
+
+def _read_cache(
+    cache_file: Path, stat: os.stat_result
+) -> Optional[tuple[list[Binding], list[MissedLine]]]:
+    """Load cached parse results, or None if missing or stale."""
+    try:
+        data = json.loads(cache_file.read_text())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict):
+        return None
+    if data.get("mtime_ns") != stat.st_mtime_ns or data.get("size") != stat.st_size:
+        return None
+    try:
+        return (
+            [Binding(*b) for b in data["bindings"]],
+            [MissedLine(*m) for m in data["missed"]],
+        )
+    except (KeyError, TypeError):
+        return None
+
+
+def _write_cache(
+    cache_file: Path,
+    stat: os.stat_result,
+    results: list[Binding],
+    missed: list[MissedLine],
+) -> None:
+    """Store parse results; failures just leave the cache cold."""
+    data = {
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "bindings": [[b.type, b.key, b.desc, b.file, b.line] for b in results],
+        "missed": [[m.file, m.line, m.content, m.parser_name] for m in missed],
+    }
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(data))
+        os.replace(tmp, cache_file)
+    except OSError:
+        pass
+
+
+def prune_cache(
+    cache_dir: Path,
+    max_age: float = _CACHE_MAX_AGE,
+    max_entries: int = _CACHE_MAX_ENTRIES,
+) -> None:
+    """Bound the parse cache by entry age and count.
+
+    Entries are keyed by path and config, so temp dirs, removed files and
+    edited parser sections leave orphans behind. Entries are rewritten
+    only when their file changes, so a live entry that ages out just costs
+    one re-parse.
+    """
+    try:
+        entries = [(e.stat().st_mtime, e.path) for e in os.scandir(cache_dir)
+                   if e.name.endswith((".json", ".tmp"))]
+    except OSError:
+        return
+    entries.sort(reverse=True)
+    cutoff = time.time() - max_age
+    for i, (mtime, entry) in enumerate(entries):
+        if i >= max_entries or mtime < cutoff:
+            try:
+                os.unlink(entry)
+            except OSError:
+                pass
+
+
 def parse_file(
     path: Path,
     cfg: dict,
     rel_path: Optional[str] = None,
     collect_missed: bool = False,
     parser_name: str = "",
+    cache_dir: Optional[Path] = None,
 ) -> tuple[list[Binding], list[MissedLine]]:
     """Parse a single file according to config.
 
     Returns (bindings, missed_lines). missed_lines is empty unless collect_missed=True.
+    With cache_dir set, results are reused while the file's mtime and size
+    are unchanged.
     """
-    if not path.exists():
+    try:
+        stat = path.stat()
+    except OSError:
         return [], []
 
     fname = rel_path if rel_path else path.name
 
+    cfg = _compile_cfg(cfg)
+
+    cache_file = None
+    if cache_dir:
+        cache_file = _cache_file(cache_dir, path, cfg, fname, collect_missed, parser_name)
+        cached = _read_cache(cache_file, stat)
+        if cached is not None:
+            return cached
+
     # Multi-line mode: match across lines
     if cfg.get("multiline", False):
-        return _parse_file_multiline(path, cfg, rel_path), []
+        results, missed = _parse_file_multiline(path, cfg, rel_path), []
+    else:
+        results, missed = _parse_file_lines(path, cfg, fname, collect_missed, parser_name)
 
-    results = []
-    missed = []
-    content = path.read_text()
-    lines = content.splitlines()
+    if cache_file:
+        _write_cache(cache_file, stat, results, missed)
+    return results, missed
 
-    regex = re.compile(cfg["regex"])
-    match_line = cfg.get("match_line")
-    skip_comment = cfg.get("skip_comment", False)
-    truncate = cfg.get("truncate", 0)
-    strip_quotes = cfg.get("strip_quotes", False)
-    desc_from_comment = cfg.get("desc_from_comment", False)
-    desc_literal = cfg.get("desc_literal")
 
-    for i, line in enumerate(lines, 1):
-        stripped = line.strip()
+def _collect_files(cfg: dict, base_dir: Path) -> list[tuple[Path, str]]:
+    """Resolve a parser section's paths to (path, display name) pairs."""
+    files = []
+    for rel_path in cfg.get("paths", []):
+        # Expand ~ to home directory
+        if rel_path.startswith("~"):
+            expanded = Path(rel_path).expanduser()
+            if "*" in rel_path:
+                for path in expanded.parent.glob(expanded.name):
+                    if path.is_file():
+                        files.append((path, str(path)))
+            elif expanded.exists():
+                files.append((expanded, str(expanded)))
+        # Support glob patterns
+        elif "*" in rel_path:
+            for path in base_dir.glob(rel_path):
+                if path.is_file():
+                    files.append((path, str(path.relative_to(base_dir))))
+        else:
+            files.append((base_dir / rel_path, rel_path))
+    return files
 
-        if skip_comment and stripped.startswith("#"):
-            continue
 
-        if match_line and not re.search(match_line, stripped):
+def _cpu_count() -> int:
+    """Get the number of CPUs this process may run on."""
+    # The affinity mask reflects taskset and cpuset cgroup limits
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def _parse_job(job: tuple) -> tuple[list[Binding], list[MissedLine]]:
+    """Run parse_file on a job tuple (picklable entry point for workers)."""
+    return parse_file(*job)
+
+
+def _prefetch(paths: Iterable[Path]) -> None:
+    """Ask the kernel to start reading files before they are parsed.
+
+    Files are parsed one after another, so on a cold page cache each read
+    waits on disk in turn. POSIX_FADV_WILLNEED queues readahead for all of
+    them at once. No-op where posix_fadvise is unavailable.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    for path in paths:
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
             continue
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+
+def _cache_entry(job: tuple) -> Optional[tuple[Path, os.stat_result]]:
+    """Get a job's cache entry path and file stat, or None if not cached."""
+    path, cfg, rel_path, collect_missed, parser_name, cache_dir = job
+    if not cache_dir:
+        return None
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    cache_file = _cache_file(
+        cache_dir, path, _compile_cfg(cfg), rel_path or path.name,
+        collect_missed, parser_name,
+    )
+    return cache_file, stat
+
+
+def _parse_jobs(jobs: list[tuple]) -> Iterator[tuple[list[Binding], list[MissedLine]]]:
+    """Parse jobs in order, spreading them over processes for large inputs.
+
+    Worker startup costs more than parsing a typical dotfiles repo, so the
+    pool is only used once the files add up to _PARALLEL_MIN_BYTES.
+    """
+    if len(jobs) > 1:
+        _prefetch(job[0] for job in jobs)
+
+    # A one-worker pool only adds process startup and pickling
+    workers = min(len(jobs), _cpu_count())
+    total = 0
+    if workers > 1:
+        for job in jobs:
+            try:
+                total += job[0].stat().st_size
+            except OSError:
+                continue
+    if workers < 2 or total < _PARALLEL_MIN_BYTES:
+        yield from map(_parse_job, jobs)
+        return
 
-        m = regex.search(stripped)
-        if not m:
-            if collect_missed:
-                missed.append(MissedLine(fname, i, stripped, parser_name))
+    done = 0
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for result in executor.map(_parse_job, jobs):
+                yield result
+                done += 1
+    except (OSError, NotImplementedError, BrokenProcessPool):
+        # No usable multiprocessing here (e.g. missing sem_open support), or
+        # workers failed to start or died; they start lazily, so this can
+        # happen mid-run. Parse whatever hasn't been yielded yet serially.
+        yield from map(_parse_job, jobs[done:])
+
+
+def _run_jobs(jobs: list[tuple]) -> Iterator[tuple[list[Binding], list[MissedLine]]]:
+    """Yield each job's results in order, parsing only cache misses.
+
+    Cache hits are resolved up front so prefetching and the process pool
+    only deal with files that are actually read. Results are yielded as
+    soon as each job (and all before it) is done.
+    """
+    entries = [_cache_entry(job) for job in jobs]
+    cached = [_read_cache(*entry) if entry else None for entry in entries]
+    # Misses are parsed without cache_dir and written back here, so their
+    # key isn't built and looked up a second time in parse_file
+    parsed = _parse_jobs([
+        job[:-1] + (None,) for job, hit in zip(jobs, cached) if hit is None
+    ])
+    for entry, hit in zip(entries, cached):
+        if hit is not None:
+            yield hit
             continue
+        results, missed = next(parsed)
+        if entry:
+            _write_cache(*entry, results, missed)
+        yield results, missed
+
+
+def _iter_parsed(
+    config: dict,
+    base_dir: Path,
+    collect_missed: bool,
+    cache_dir: Optional[Path],
+) -> Iterator[tuple[list[Binding], list[MissedLine]]]:
+    """Yield (bindings, missed_lines) per query engine and per parsed file."""
+    # Handle query engines (top-level setting)
+    query_engines = config.get("query_engines", [])
+    engine_configs = config.get("engine", {})
+    for engine in query_engines:
+        if engine == "nvim":
+            nvim_cfg = engine_configs.get("nvim", {})
+            yield query_nvim_keymaps(nvim_cfg, base_dir), []
 
-        key = m.group(cfg.get("key_group", 1))
+    # Skip non-parser entries and the engine config namespace
+    sections = [
+        (name, cfg) for name, cfg in config.items()
+        if isinstance(cfg, dict) and name != "engine"
+    ]
+    # Higher priority sections are parsed (and streamed) first; the sort is
+    # stable, so equal priorities keep config order
+    sections.sort(key=lambda section: -section[1].get("priority", 0))
 
-        # Determine description
-        if desc_literal:
-            desc = desc_literal
-        elif desc_from_comment:
-            if "#" in line:
-                desc = line.split("#", 1)[1].strip()
-            else:
-                func_match = re.search(r"['\"][^'\"]+['\"]\s+(\S+)", stripped)
-                desc = func_match.group(1) if func_match else stripped[:40]
-        elif cfg.get("desc_group"):
-            desc = m.group(cfg["desc_group"]).strip()
-        else:
-            desc = ""
+    jobs = []
+    for name, cfg in sections:
+        cfg = _compile_cfg(cfg)
+        for path, file_rel in _collect_files(cfg, base_dir):
+            jobs.append((path, cfg, file_rel, collect_missed, name, cache_dir))
 
-        if strip_quotes:
-            desc = desc.strip("'\"")
-        if truncate and len(desc) > truncate:
-            desc = desc[:truncate]
+    yield from _run_jobs(jobs)
 
-        results.append(Binding(cfg["type"], key, desc, fname, i))
 
-    return results, missed
+def iter_bindings(
+    config_path: Path, base_dir: Path, cache_dir: Optional[Path] = None
+) -> Iterator[Binding]:
+    """Yield bindings as each file is parsed.
+
+    Lazy counterpart of parse_all for streaming output: a consumer that
+    stops early skips parsing the remaining files.
+    """
+    config = load_config(config_path)
+    for results, _ in _iter_parsed(config, base_dir, False, cache_dir):
+        yield from results
 
 
 def parse_all(
-    config_path: Path, base_dir: Path, collect_missed: bool = False
+    config_path: Path,
+    base_dir: Path,
+    collect_missed: bool = False,
+    cache_dir: Optional[Path] = None,
 ) -> tuple[list[Binding], list[MissedLine]]:
     """Parse all configs and return bindings.
 
     Returns (bindings, missed_lines). missed_lines is empty unless collect_missed=True.
+    cache_dir enables the per-file result cache (see parse_file).
     """
     config = load_config(config_path)
     all_results = []
     all_missed = []
-
-    # Handle query engines (top-level setting)
-    query_engines = config.get("query_engines", [])
-    engine_configs = config.get("engine", {})
-    for engine in query_engines:
-        if engine == "nvim":
-            nvim_cfg = engine_configs.get("nvim", {})
-            all_results.extend(query_nvim_keymaps(nvim_cfg, base_dir))
-
-    for name, cfg in config.items():
-        # Skip non-parser entries
-        if not isinstance(cfg, dict):
-            continue
-        # Skip engine config namespace
-        if name == "engine":
-            continue
-        for rel_path in cfg.get("paths", []):
-            # Expand ~ to home directory
-            if rel_path.startswith("~"):
-                expanded = Path(rel_path).expanduser()
-                if "*" in rel_path:
-                    for path in expanded.parent.glob(expanded.name):
-                        if path.is_file():
-                            results, missed = parse_file(
-                                path, cfg, str(path), collect_missed, name
-                            )
-                            all_results.extend(results)
-                            all_missed.extend(missed)
-                elif expanded.exists():
-                    results, missed = parse_file(
-                        expanded, cfg, str(expanded), collect_missed, name
-                    )
-                    all_results.extend(results)
-                    all_missed.extend(missed)
-            # Support glob patterns
-            elif "*" in rel_path:
-                for path in base_dir.glob(rel_path):
-                    if path.is_file():
-                        file_rel = str(path.relative_to(base_dir))
-                        results, missed = parse_file(
-                            path, cfg, file_rel, collect_missed, name
-                        )
-                        all_results.extend(results)
-                        all_missed.extend(missed)
-            else:
-                path = base_dir / rel_path
-                results, missed = parse_file(path, cfg, rel_path, collect_missed, name)
-                all_results.extend(results)
-                all_missed.extend(missed)
+    for results, missed in _iter_parsed(config, base_dir, collect_missed, cache_dir):
+        all_results.extend(results)
+        all_missed.extend(missed)
 
     return all_results, all_missed
 
@@ -305,10 +726,15 @@ def find_conflicts(bindings: list[Binding]) -> dict[tuple[str, str], list[Bindin
     Returns dict mapping (type, key) to list of bindings with that key.
     Only includes entries with 2+ bindings.
     """
-    from collections import defaultdict
-
-    by_key: dict[tuple[str, str], list[Binding]] = defaultdict(list)
-    for b in bindings:
-        by_key[(b.type, b.key)].append(b)
-
-    return {k: v for k, v in by_key.items() if len(v) > 1}
+    from collections import Counter
+    from operator import attrgetter
+
+    # Count first so lists are only built for the (rare) duplicated keys
+    keys = list(map(attrgetter("type", "key"), bindings))
+    counts = Counter(keys)
+
+    conflicts: dict[tuple[str, str], list[Binding]] = {}
+    for k, b in zip(keys, bindings):
+        if counts[k] > 1:
+            conflicts.setdefault(k, []).append(b)
+    return conflicts
@@ -83,6 +83,29 @@ class TestCLI:
         assert data[0]["type"] == "tmux"
         assert "key" in data[0]
 
+    def test_output_format_json_unicode(self, temp_config):
+        """JSON output is UTF-8 and keeps non-ASCII text."""
+        import json
+        base, config = temp_config
+        (base / ".tmux.conf").write_text("bind é café ☕")
+
+        result = subprocess.run(
+            ["confhelp", "-c", str(config), "-b", str(base), "-f", "json", "--no-cache"],
+            capture_output=True,
+        )
+
+        data = json.loads(result.stdout.decode("utf-8"))
+        assert data[0]["key"] == "é"
+        assert data[0]["desc"].strip() == "café ☕"
+
+    def test_dump_json_matches_stdlib(self):
+        """orjson and stdlib paths produce the same document."""
+        import json
+        from bindings_help.cli import dump_json
+
+        data = [{"type": "tmux", "key": "r", "desc": "réload", "file": ".tmux.conf", "line": 1}]
+        assert dump_json(data) == json.dumps(data, indent=2, ensure_ascii=False).encode()
+
     def test_output_format_tsv(self, temp_config):
         """TSV format uses tabs."""
         base, config = temp_config
@@ -97,6 +120,38 @@ class TestCLI:
         assert "\t" in lines[0]
         assert lines[0].count("\t") == 3  # type, key, desc, file:line
 
+    def test_no_cache_flag(self, temp_config):
+        """--no-cache parses without touching the cache directory."""
+        import os
+        base, config = temp_config
+        cache_home = base / "cache"
+
+        result = subprocess.run(
+            ["confhelp", "-c", str(config), "-b", str(base), "--no-cache"],
+            capture_output=True,
+            text=True,
+            env={**os.environ, "XDG_CACHE_HOME": str(cache_home)},
+        )
+
+        assert result.stdout.count("\n") == 26
+        assert not cache_home.exists()
+
+    def test_cache_dir_from_xdg(self, temp_config):
+        """Parse results are cached under $XDG_CACHE_HOME/confhelp."""
+        import os
+        base, config = temp_config
+        cache_home = base / "cache"
+
+        result = subprocess.run(
+            ["confhelp", "-c", str(config), "-b", str(base)],
+            capture_output=True,
+            text=True,
+            env={**os.environ, "XDG_CACHE_HOME": str(cache_home)},
+        )
+
+        assert result.stdout.count("\n") == 26
+        assert list((cache_home / "confhelp/parse").glob("*.json"))
+
     def test_missing_base_dir_error(self, temp_config):
         """Error when base-dir not provided."""
         _, config = temp_config
@@ -451,3 +506,86 @@ truncate = 60
 
             # Should not fail trying to parse [nvim] as regex config
             assert result.returncode == 0
+
+
+class TestWriteLines:
+    def test_chunks_joined(self, capsys):
+        from bindings_help.cli import write_lines
+
+        write_lines((f"line{i}" for i in range(5)), chunk_size=2)
+        assert capsys.readouterr().out == "".join(f"line{i}\n" for i in range(5))
+
+    def test_empty(self, capsys):
+        from bindings_help.cli import write_lines
+
+        write_lines([])
+        assert capsys.readouterr().out == ""
+
+
+class TestFzfEntries:
+    def test_index_prefix(self):
+        from bindings_help.cli import fzf_entries
+
+        entries = fzf_entries(["[tmux]|r|reload|.tmux.conf:1", "[alias]|gs|git status|.aliases:2"])
+        assert entries == [
+            "0\t[tmux]   r   reload      .tmux.conf:1",
+            "1\t[alias]  gs  git status  .aliases:2",
+        ]
+
+    def test_fzf_hides_index(self):
+        """fzf returns the hidden index field with the selected line."""
+        from bindings_help.cli import fzf_entries
+        from iterfzf import iterfzf
+
+        entries = fzf_entries(["[tmux]|0|zero|.tmux.conf:1", "[tmux]|r|reload|.tmux.conf:2"])
+        # Non-interactive --filter; it prints the transformed line when combined
+        # with --no-sort, so sort here (interactive accept prints the original)
+        selection = iterfzf(
+            entries, sort=True, __extra__=["--delimiter=\t", "--with-nth=2..", "--filter=reload"]
+        )
+        assert selection.split("\t", 1)[0] == "1"
+
+
+class TestAlignColumns:
+    def test_aligns_fields(self):
+        from bindings_help.cli import align_columns
+
+        lines = ["[tmux]|r|reload|.tmux.conf:1", "[alias]|gs|git status|.zsh_aliases:15"]
+        assert align_columns(lines) == [
+            "[tmux]   r   reload      .tmux.conf:1",
+            "[alias]  gs  git status  .zsh_aliases:15",
+        ]
+
+    def test_empty_field_kept(self):
+        from bindings_help.cli import align_columns
+
+        assert align_columns(["[func]|f||.funcs:1", "[func]|g|x|.funcs:2"]) == [
+            "[func]  f     .funcs:1",
+            "[func]  g  x  .funcs:2",
+        ]
+
+    def test_ragged_rows(self):
+        """A desc containing the separator adds a field; location stays last."""
+        from bindings_help.cli import align_columns
+
+        result = align_columns(["[alias]|G|'| grep'|.aliases:1", "[alias]|ll|ls -l|.aliases:2"])
+        assert [r.split()[-1] for r in result] == [".aliases:1", ".aliases:2"]
+
+    def test_wide_chars(self):
+        """Columns line up by display width, as column(1) does."""
+        from bindings_help.cli import align_columns
+
+        cafe = "cafe\u0301"  # combining accent takes no column
+        result = align_columns(["[alias]|c|☕ coffee|.aliases:1", "[alias]|d|日本|.aliases:2",
+                                f"[alias]|e|{cafe}|.aliases:3", "[alias]|f|plain|.aliases:4"])
+        assert result == [
+            "[alias]  c  ☕ coffee  .aliases:1",
+            "[alias]  d  日本       .aliases:2",
+            f"[alias]  e  {cafe}       .aliases:3",
+            "[alias]  f  plain      .aliases:4",
+        ]
+
+    def test_empty(self):
+        from bindings_help.cli import align_columns
+
+        assert align_columns([]) == []
@@ -1,11 +1,15 @@
 """Tests for the config-driven parser."""
 
+import shutil
 import tempfile
 from pathlib import Path
 
 import pytest
 
-from bindings_help.parser import parse_file, parse_all, load_config, Binding, find_conflicts, MissedLine
+from bindings_help.parser import (
+    parse_file, parse_all, iter_bindings, load_config, Binding, find_conflicts, MissedLine,
+    _compile_cfg, _index_lua_descs, _rg_lua_descs, _scan_lua_descs,
+)
 
 
 @pytest.fixture
@@ -84,6 +88,21 @@ myfunc() {
         assert results[0].key == "myfunc"
         assert results[0].desc == "(function)"
 
+    def test_desc_literal_finalized(self, temp_dir):
+        """strip_quotes and truncate apply to desc_literal too."""
+        config = {
+            "type": "func",
+            "regex": r"(\w+)\s*\(\)",
+            "desc_literal": "'function'",
+            "strip_quotes": True,
+            "truncate": 4,
+        }
+        f = temp_dir / ".funcs"
+        f.write_text("a() {\n}\nb() {\n}")
+
+        results, _ = parse_file(f, config)
+        assert [r.desc for r in results] == ["func", "func"]
+
     def test_parse_abbrev_regex(self, temp_dir):
         config = {
             "type": "abbr",
@@ -127,6 +146,201 @@ abbrevs=(
         assert len(results[0].desc) == 10
 
 
+class TestCompileCfg:
+    def test_compiles_regex_and_match_line(self):
+        cfg = _compile_cfg({"type": "tmux", "match_line": "^bind", "regex": r"bind\s+(\S+)"})
+        assert cfg["regex"].search("bind r reload").group(1) == "r"
+        assert cfg["match_line"].search("bind r reload")
+
+    def test_idempotent(self):
+        cfg = _compile_cfg({"type": "test", "regex": r"(\w+)"})
+        assert _compile_cfg(cfg) is cfg
+
+    def test_does_not_mutate_input(self):
+        raw = {"type": "test", "regex": r"(\w+)"}
+        _compile_cfg(raw)
+        assert raw["regex"] == r"(\w+)"
+
+    def test_parse_file_accepts_compiled_cfg(self, temp_dir):
+        f = temp_dir / "conf"
+        f.write_text("bind r reload\nset -g x")
+        cfg = _compile_cfg({"type": "tmux", "match_line": "^bind", "regex": r"bind\s+(\S+)"})
+
+        results, _ = parse_file(f, cfg)
+        assert [r.key for r in results] == ["r"]
+
+
+class TestParseCache:
+    CONFIG = {"type": "tmux", "regex": r"bind\s+(\S+)\s+(.*)", "key_group": 1, "desc_group": 2}
+
+    def test_cache_written_and_reused(self, temp_dir):
+        cache_dir = temp_dir / "cache"
+        f = temp_dir / ".tmux.conf"
+        f.write_text("bind r reload")
+
+        first, _ = parse_file(f, self.CONFIG, cache_dir=cache_dir)
+        assert len(list(cache_dir.glob("*.json"))) == 1
+
+        # Edit the cached payload: a hit must return it instead of re-parsing
+        entry = next(cache_dir.glob("*.json"))
+        entry.write_text(entry.read_text().replace("reload", "cached"))
+        second, _ = parse_file(f, self.CONFIG, cache_dir=cache_dir)
+        assert first[0].desc == "reload"
+        assert second[0].desc == "cached"
+        assert second[0].line == 1
+
+    def test_cache_invalidated_on_change(self, temp_dir):
+        cache_dir = temp_dir / "cache"
+        f = temp_dir / ".tmux.conf"
+        f.write_text("bind r reload")
+        parse_file(f, self.CONFIG, cache_dir=cache_dir)
+
+        f.write_text("bind v split-window")
+        results, _ = parse_file(f, self.CONFIG, cache_dir=cache_dir)
+        assert results[0].key == "v"
+        # Stale entry is overwritten, not duplicated
+        assert len(list(cache_dir.glob("*.json"))) == 1
+
+    def test_cache_keyed_by_config(self, temp_dir):
+        cache_dir = temp_dir / "cache"
+        f = temp_dir / ".tmux.conf"
+        f.write_text("bind r reload")
+        parse_file(f, self.CONFIG, cache_dir=cache_dir)
+
+        results, _ = parse_file(f, {**self.CONFIG, "truncate": 3}, cache_dir=cache_dir)
+        assert results[0].desc == "rel"
+
+    def test_parse_all_looks_up_each_file_once(self, temp_dir, monkeypatch):
+        from bindings_help import parser
+
+        config_toml = temp_dir / "config.toml"
+        config_toml.write_text("""
+[tmux]
+paths = [".tmux1", ".tmux2"]
+regex = 'bind\\s+(\\S+)'
+type = "tmux"
+""")
+        (temp_dir / ".tmux1").write_text("bind r reload")
+        (temp_dir / ".tmux2").write_text("bind v split")
+        cache_dir = temp_dir / "cache"
+        reads = []
+        read_cache = parser._read_cache
+        monkeypatch.setattr(
+            parser, "_read_cache", lambda *args: reads.append(args) or read_cache(*args)
+        )
+
+        cold, _ = parse_all(config_toml, temp_dir, cache_dir=cache_dir)
+        assert len(reads) == 2
+        assert len(list(cache_dir.glob("*.json"))) == 2
+
+        warm, _ = parse_all(config_toml, temp_dir, cache_dir=cache_dir)
+        assert len(reads) == 4
+        assert warm == cold
+
+    def test_cache_keeps_missed_lines(self, temp_dir):
+        cache_dir = temp_dir / "cache"
+        config = {"type": "tmux", "match_line": "^bind", "regex": r"bind\s+(\w)\s+"}
+        f = temp_dir / ".tmux.conf"
+        f.write_text("bind C-h select-pane")
+
+        parse_file(f, config, collect_missed=True, parser_name="tmux", cache_dir=cache_dir)
+        _, missed = parse_file(
+            f, config, collect_missed=True, parser_name="tmux", cache_dir=cache_dir
+        )
+        assert missed == [MissedLine(".tmux.conf", 1, "bind C-h select-pane", "tmux")]
+
+    def test_cache_keyed_by_full_regex(self, temp_dir):
+        """Regexes that differ past str(Pattern)'s 200-char cutoff get separate entries."""
+        cache_dir = temp_dir / "cache"
+        prefix = "(?:" + "|".join(f"x{i:03d}" for i in range(50)) + ")?"
+        assert len(prefix) > 200
+        f = temp_dir / "conf"
+        f.write_text("foo bar")
+
+        base = {"type": "test", "key_group": 1, "desc_group": 2}
+        first, _ = parse_file(f, {**base, "regex": prefix + r"(foo) (.*)"}, cache_dir=cache_dir)
+        second, _ = parse_file(f, {**base, "regex": prefix + r"(foo) (b)"}, cache_dir=cache_dir)
+
+        assert first[0].desc == "bar"
+        assert second[0].desc == "b"
+
+    @pytest.mark.parametrize("payload", ["[]", "42", '{"mtime_ns": 0}', "{}"])
+    def test_malformed_entry_is_a_miss(self, temp_dir, payload):
+        cache_dir = temp_dir / "cache"
+        f = temp_dir / ".tmux.conf"
+        f.write_text("bind r reload")
+        parse_file(f, self.CONFIG, cache_dir=cache_dir)
+
+        entry = next(cache_dir.glob("*.json"))
+        entry.write_text(payload)
+        results, _ = parse_file(f, self.CONFIG, cache_dir=cache_dir)
+        assert results[0].desc == "reload"
+
+    def test_malformed_bindings_are_a_miss(self, temp_dir):
+        import json
+
+        cache_dir = temp_dir / "cache"
+        f = temp_dir / ".tmux.conf"
+        f.write_text("bind r reload")
+        parse_file(f, self.CONFIG, cache_dir=cache_dir)
+
+        entry = next(cache_dir.glob("*.json"))
+        data = json.loads(entry.read_text())
+        data["bindings"] = [["too", "few"]]
+        entry.write_text(json.dumps(data))
+        results, _ = parse_file(f, self.CONFIG, cache_dir=cache_dir)
+        assert results[0].desc == "reload"
+
+    def test_no_cache_by_default(self, temp_dir):
+        f = temp_dir / ".tmux.conf"
+        f.write_text("bind r reload")
+        parse_file(f, self.CONFIG)
+        assert list(temp_dir.iterdir()) == [f]
+
+
+class TestPruneCache:
+    def _entries(self, cache_dir, ages):
+        import os
+        import time
+
+        cache_dir.mkdir()
+        now = time.time()
+        for i, age in enumerate(ages):
+            entry = cache_dir / f"{i}.json"
+            entry.write_text("{}")
+            os.utime(entry, (now - age, now - age))
+
+    def test_drops_old_entries(self, temp_dir):
+        from bindings_help.parser import prune_cache
+
+        cache_dir = temp_dir / "cache"
+        self._entries(cache_dir, [0, 100, 10_000])
+        prune_cache(cache_dir, max_age=1000)
+        assert sorted(p.name for p in cache_dir.iterdir()) == ["0.json", "1.json"]
+
+    def test_keeps_newest_within_limit(self, temp_dir):
+        from bindings_help.parser import prune_cache
+
+        cache_dir = temp_dir / "cache"
+        self._entries(cache_dir, [30, 10, 20, 40])
+        prune_cache(cache_dir, max_entries=2)
+        assert sorted(p.name for p in cache_dir.iterdir()) == ["1.json", "2.json"]
+
+    def test_leaves_other_files(self, temp_dir):
+        from bindings_help.parser import prune_cache
+
+        cache_dir = temp_dir / "cache"
+        self._entries(cache_dir, [10])
+        (cache_dir / "notes.txt").write_text("keep")
+        prune_cache(cache_dir, max_entries=0)
+        assert [p.name for p in cache_dir.iterdir()] == ["notes.txt"]
+
+    def test_missing_dir(self, temp_dir):
+        from bindings_help.parser import prune_cache
+
+        prune_cache(temp_dir / "missing")
+
+
 class TestParseAll:
     def test_parse_multiple_files(self, temp_dir):
         config_toml = temp_dir / "config.toml"
@@ -154,6 +368,202 @@ type = "alias"
         assert types == {"tmux", "alias"}
 
 
+    def test_parallel_matches_serial(self, temp_dir, monkeypatch):
+        from bindings_help import parser
+
+        config_toml = temp_dir / "config.toml"
+        config_toml.write_text("""
+[alias]
+paths = ["aliases/*"]
+regex = 'alias\\s+(\\w+)=(.*)'
+key_group = 1
+desc_group = 2
+type = "alias"
+""")
+        (temp_dir / "aliases").mkdir()
+        for i in range(6):
+            (temp_dir / f"aliases/{i}").write_text(f"alias a{i}=one\nalias b{i}=two")
+
+        serial, _ = parse_all(config_toml, temp_dir)
+        monkeypatch.setattr(parser, "_PARALLEL_MIN_BYTES", 0)
+        monkeypatch.setattr(parser, "_cpu_count", lambda: 2)
+        parallel, _ = parse_all(config_toml, temp_dir)
+
+        assert len(serial) == 12
+        assert parallel == serial
+
+    def test_single_cpu_stays_serial(self, temp_dir, monkeypatch):
+        from bindings_help import parser
+
+        def no_pool(*args, **kwargs):
+            raise AssertionError("process pool started")
+
+        f = temp_dir / ".aliases"
+        f.write_text("alias a=one")
+        jobs = [(f, {"type": "alias", "regex": r"alias\s+(\w+)="}, None, False, "", None)] * 3
+        monkeypatch.setattr(parser, "_PARALLEL_MIN_BYTES", 0)
+        monkeypatch.setattr(parser, "_cpu_count", lambda: 1)
+        monkeypatch.setattr(parser, "ProcessPoolExecutor", no_pool)
+
+        results = list(parser._run_jobs(jobs))
+        assert [b.key for bindings, _ in results for b in bindings] == ["a", "a", "a"]
+
+    @pytest.mark.parametrize("fail_after", [0, 1])
+    def test_broken_pool_falls_back(self, temp_dir, monkeypatch, fail_after):
+        """Workers that fail to start or die mid-run don't lose or repeat files."""
+        from concurrent.futures.process import BrokenProcessPool
+
+        from bindings_help import parser
+
+        class BrokenPool:
+            def __init__(self, max_workers):
+                pass
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+            def map(self, fn, jobs):
+                for job in jobs[:fail_after]:
+                    yield fn(job)
+                raise BrokenProcessPool("worker died")
+
+        cfg = {"type": "alias", "regex": r"alias\s+(\w+)="}
+        jobs = []
+        for i in range(3):
+            f = temp_dir / f".aliases{i}"
+            f.write_text(f"alias a{i}=one")
+            jobs.append((f, cfg, None, False, "", None))
+        monkeypatch.setattr(parser, "_PARALLEL_MIN_BYTES", 0)
+        monkeypatch.setattr(parser, "_cpu_count", lambda: 2)
+        monkeypatch.setattr(parser, "ProcessPoolExecutor", BrokenPool)
+
+        results = list(parser._run_jobs(jobs))
+        assert [b.key for bindings, _ in results for b in bindings] == ["a0", "a1", "a2"]
+
+
+class TestPrefetch:
+    @pytest.fixture
+    def fadvise_calls(self, monkeypatch):
+        from bindings_help import parser
+
+        calls = []
+        monkeypatch.setattr(
+            parser.os, "posix_fadvise", lambda *args: calls.append(args), raising=False
+        )
+        return calls
+
+    def test_skips_unreadable_paths(self, temp_dir, fadvise_calls):
+        from bindings_help.parser import _prefetch
+
+        f = temp_dir / "conf"
+        f.write_text("bind r reload")
+        _prefetch([temp_dir / "missing", f])
+        assert len(fadvise_calls) == 1
+
+    def test_noop_without_fadvise(self, temp_dir, monkeypatch):
+        from bindings_help import parser
+
+        opened = []
+        f = temp_dir / "conf"
+        f.write_text("bind r reload")
+        with monkeypatch.context() as m:
+            m.delattr(parser.os, "posix_fadvise", raising=False)
+            m.setattr(parser.os, "open", lambda *args: opened.append(args))
+            parser._prefetch([f])
+        assert opened == []
+
+    def test_only_cache_misses_prefetched(self, temp_dir, fadvise_calls):
+        config_toml = temp_dir / "config.toml"
+        config_toml.write_text("""
+[alias]
+paths = [".a1", ".a2", ".a3"]
+regex = 'alias\\s+(\\w+)='
+key_group = 1
+type = "alias"
+""")
+        for name in (".a1", ".a2", ".a3"):
+            (temp_dir / name).write_text("alias foo=bar")
+        cache_dir = temp_dir / "cache"
+
+        parse_all(config_toml, temp_dir, cache_dir=cache_dir)
+        assert len(fadvise_calls) == 3
+
+        fadvise_calls.clear()
+        parse_all(config_toml, temp_dir, cache_dir=cache_dir)
+        assert fadvise_calls == []
+
+        (temp_dir / ".a1").write_text("alias one=two")
+        (temp_dir / ".a3").write_text("alias three=four")
+        results, _ = parse_all(config_toml, temp_dir, cache_dir=cache_dir)
+        assert len(fadvise_calls) == 2
+        assert [b.key for b in results] == ["one", "foo", "three"]
+
+
+class TestIterBindings:
+    CONFIG = """
+[alias]
+paths = [".aliases1", ".aliases2"]
+regex = 'alias\\s+(\\w+)='
+key_group = 1
+type = "alias"
+"""
+
+    def test_matches_parse_all(self, temp_dir):
+        config_toml = temp_dir / "config.toml"
+        config_toml.write_text(self.CONFIG)
+        (temp_dir / ".aliases1").write_text("alias foo=bar\nalias baz=qux")
+        (temp_dir / ".aliases2").write_text("alias one=two")
+
+        results, _ = parse_all(config_toml, temp_dir)
+        assert list(iter_bindings(config_toml, temp_dir)) == results
+
+    def test_lazy(self, temp_dir):
+        """Files after the consumed bindings are never parsed."""
+        config_toml = temp_dir / "config.toml"
+        config_toml.write_text(self.CONFIG)
+        (temp_dir / ".aliases1").write_text("alias foo=bar")
+        (temp_dir / ".aliases2").write_text("alias one=two")
+        cache_dir = temp_dir / "cache"
+
+        first = next(iter_bindings(config_toml, temp_dir, cache_dir=cache_dir))
+        assert first.key == "foo"
+        assert len(list(cache_dir.glob("*.json"))) == 1
+
+
+class TestPriority:
+    def test_priority_orders_sections(self, temp_dir):
+        config_toml = temp_dir / "config.toml"
+        config_toml.write_text("""
+[alias]
+paths = [".aliases"]
+regex = 'alias\\s+(\\w+)='
+key_group = 1
+type = "alias"
+
+[func]
+paths = [".funcs"]
+regex = '(\\w+)\\(\\)'
+key_group = 1
+type = "func"
+
+[tmux]
+paths = [".tmux.conf"]
+regex = 'bind\\s+(\\S+)'
+key_group = 1
+type = "tmux"
+priority = 10
+""")
+        (temp_dir / ".aliases").write_text("alias ls='exa'")
+        (temp_dir / ".funcs").write_text("myfunc() {")
+        (temp_dir / ".tmux.conf").write_text("bind r reload")
+
+        results, _ = parse_all(config_toml, temp_dir)
+        assert [r.type for r in results] == ["tmux", "alias", "func"]
+
+
 class TestBinding:
     def test_to_line(self):
         b = Binding("tmux", "r", "reload config", ".tmux.conf", 42)
@@ -163,6 +573,14 @@ class TestBinding:
         b = Binding("func", "myfunc", "", ".funcs", 1)
         assert b.to_line() == "[func]|myfunc||.funcs:1"
 
+    def test_slots(self):
+        b = Binding("tmux", "r", "reload config", ".tmux.conf", 42)
+        m = MissedLine(".tmux.conf", 1, "bind", "tmux")
+        assert not hasattr(b, "__dict__")
+        assert not hasattr(m, "__dict__")
+        with pytest.raises(AttributeError):
+            b.extra = 1
+
 
 class TestEdgeCases:
     def test_match_line_filter(self, temp_dir):
@@ -227,6 +645,35 @@ type = "alias"
         keys = {r.key for r in results}
         assert keys == {"foo", "baz"}
 
+    def test_multiline_line_numbers(self, temp_dir):
+        config = {
+            "type": "lua",
+            "multiline": True,
+            "regex": r'map\(\s*"([^"]+)",.*?desc = "([^"]+)"',
+            "key_group": 1,
+            "desc_group": 2,
+        }
+        f = temp_dir / "keys.lua"
+        f.write_text(
+            '-- keys\nmap(\n  "<leader>a",\n  { desc = "first" })\n'
+            '\nmap("<leader>b", { desc = "second" })\n'
+        )
+
+        results, _ = parse_file(f, config)
+        assert [(r.key, r.desc, r.line) for r in results] == [
+            ("<leader>a", "first", 2),
+            ("<leader>b", "second", 6),
+        ]
+
+    def test_multiline_match_at_newline(self, temp_dir):
+        """A match starting on a newline belongs to the line it ends."""
+        config = {"type": "test", "multiline": True, "regex": r"\n(x)"}
+        f = temp_dir / "conf"
+        f.write_text("a\nx\n")
+
+        results, _ = parse_file(f, config)
+        assert results[0].line == 1
+
     def test_line_numbers_correct(self, temp_dir):
         config = {"type": "test", "regex": r"test(\d+)"}
         f = temp_dir / "conf"
@@ -237,6 +684,15 @@ type = "alias"
         assert results[1].line == 4
         assert results[2].line == 5
 
+    def test_line_numbers_ignore_form_feed(self, temp_dir):
+        """Only newlines count as line breaks, as in an editor."""
+        config = {"type": "test", "regex": r"test(\d+)"}
+        f = temp_dir / "conf"
+        f.write_text("# section\x0c\ntest1\r\ntest2")
+
+        results, _ = parse_file(f, config)
+        assert [r.line for r in results] == [2, 3]
+
     def test_strip_quotes_various(self, temp_dir):
         config = {
             "type": "alias",
@@ -437,3 +893,154 @@ class TestFindConflicts:
 
         assert len(conflicts) == 1
         assert ("alias", "gs") in conflicts
+
+    def test_conflict_order_preserved(self):
+        bindings = [
+            Binding("tmux", "v", "split", ".tmux.conf", 1),
+            Binding("tmux", "r", "reload", ".tmux.conf", 2),
+            Binding("tmux", "r", "restart", ".tmux.conf", 3),
+            Binding("tmux", "v", "vsplit", ".tmux.conf", 4),
+            Binding("tmux", "r", "rename", ".tmux.conf", 5),
+        ]
+
+        conflicts = find_conflicts(bindings)
+
+        assert list(conflicts) == [("tmux", "v"), ("tmux", "r")]
+        assert [b.line for b in conflicts[("tmux", "r")]] == [2, 3, 5]
+
+
+class TestIndexLuaDescs:
+    def test_index_descs(self, temp_dir):
+        nvim_dir = temp_dir / ".config/nvim"
+        (nvim_dir / "lua").mkdir(parents=True)
+        (nvim_dir / "init.lua").write_text(
+            '-- init\nmap("n", "<leader>a", cmd, { desc = "Find files" })\n'
+        )
+        (nvim_dir / "lua/keys.lua").write_text(
+            "map('n', 'x', cmd, {\n  desc = 'Single quoted',\n})\n"
+            "map('n', 'y', cmd, { desc = \"It's here\" })\n"
+        )
+
+        index = _index_lua_descs(nvim_dir, temp_dir)
+
+        assert len(index) == 3
+        assert index.get("Find files") == (".config/nvim/init.lua", 2)
+        assert index.get("Single quoted") == (".config/nvim/lua/keys.lua", 2)
+        assert index.get("It's here") == (".config/nvim/lua/keys.lua", 4)
+        assert index.get("missing") is None
+
+    def test_first_desc_per_line(self, temp_dir):
+        nvim_dir = temp_dir / ".config/nvim"
+        nvim_dir.mkdir(parents=True)
+        (nvim_dir / "init.lua").write_text('x = { desc = "one" }, { desc = "two" }\n')
+
+        index = _index_lua_descs(nvim_dir, temp_dir)
+        assert index.get("one") == (".config/nvim/init.lua", 1)
+        assert index.get("two") is None
+
+    def test_first_desc_per_line_any_quotes(self, temp_dir):
+        """The earliest desc wins whatever its quotes; double quotes used to take priority."""
+        nvim_dir = temp_dir / ".config/nvim"
+        nvim_dir.mkdir(parents=True)
+        (nvim_dir / "init.lua").write_text("""x = { desc = 'one' }, { desc = "two" }\n""")
+
+        index = _index_lua_descs(nvim_dir, temp_dir)
+        assert index.get("one") == (".config/nvim/init.lua", 1)
+        assert index.get("two") is None
+
+    def test_last_duplicate_wins(self, temp_dir):
+        nvim_dir = temp_dir / ".config/nvim"
+        nvim_dir.mkdir(parents=True)
+        (nvim_dir / "a.lua").write_text('x = { desc = "dup" }\n')
+        (nvim_dir / "b.lua").write_text('\ny = { desc = "dup" }\n')
+
+        index = _index_lua_descs(nvim_dir, temp_dir)
+        assert len(index) == 1
+        assert index.get("dup") == (".config/nvim/b.lua", 2)
+
+    def test_desc_does_not_span_lines(self, temp_dir):
+        nvim_dir = temp_dir / ".config/nvim"
+        nvim_dir.mkdir(parents=True)
+        (nvim_dir / "init.lua").write_text('desc =\n"orphan"\ndesc = "\nbroken"\n')
+
+        assert len(_index_lua_descs(nvim_dir, temp_dir)) == 0
+
+    def test_falls_back_when_rg_unusable(self, temp_dir, monkeypatch):
+        from bindings_help import parser
+
+        nvim_dir = temp_dir / ".config/nvim"
+        nvim_dir.mkdir(parents=True)
+        (nvim_dir / "init.lua").write_text('x = { desc = "one" }\n')
+        # rg "found" but can't be executed
+        monkeypatch.setattr(parser.shutil, "which", lambda cmd: "/nonexistent/rg")
+        monkeypatch.setenv("PATH", str(temp_dir))
+
+        assert _index_lua_descs(nvim_dir, temp_dir).get("one") == (".config/nvim/init.lua", 1)
+
+    @pytest.mark.skipif(not shutil.which("rg"), reason="ripgrep not installed")
+    def test_rg_matches_python_scan(self, temp_dir):
+        nvim_dir = temp_dir / ".config/nvim"
+        (nvim_dir / "lua/plugins").mkdir(parents=True)
+        (nvim_dir / "init.lua").write_text(
+            'map("n", "a", x, { desc = "Find: files" })\n'
+            "map('n', 'b', x, { desc = 'It\"s' }) -- desc = \"second\"\n"
+            'desc = "dup"\n'
+        )
+        (nvim_dir / "lua/plugins/lsp.lua").write_text('\n\nk(1, { desc = "dup" })\n')
+        (nvim_dir / "notes.txt").write_text('desc = "ignored"\n')
+        # Gitignored, hidden and non-UTF-8 files are indexed either way
+        (nvim_dir / ".gitignore").write_text("lua/generated/\n")
+        (nvim_dir / "lua/generated").mkdir()
+        (nvim_dir / "lua/generated/keys.lua").write_text('k(1, { desc = "generated" })\n')
+        (nvim_dir / ".hidden").mkdir()
+        (nvim_dir / ".hidden/keys.lua").write_text('k(1, { desc = "hidden" })\n')
+        (nvim_dir / "latin1.lua").write_bytes(b'-- caf\xe9\nk(1, { desc = "latin1" })\n')
+
+        rg, scan = _rg_lua_descs(nvim_dir, temp_dir), _scan_lua_descs(nvim_dir, temp_dir)
+        assert rg.index == scan.index
+        assert rg.files == scan.files
+        assert rg.lines == scan.lines
+
+    def test_scan_indexes_hidden_and_undecodable_files(self, temp_dir):
+        nvim_dir = temp_dir / ".config/nvim"
+        (nvim_dir / ".hidden").mkdir(parents=True)
+        (nvim_dir / ".hidden/keys.lua").write_text('k(1, { desc = "hidden" })\n')
+        (nvim_dir / "latin1.lua").write_bytes(b'-- caf\xe9\nk(1, { desc = "latin1" })\n')
+
+        index = _scan_lua_descs(nvim_dir, temp_dir)
+        assert index.get("hidden") == (".config/nvim/.hidden/keys.lua", 1)
+        assert index.get("latin1") == (".config/nvim/latin1.lua", 2)
+
+    def test_rg_invocation(self, temp_dir, monkeypatch):
+        """rg is told not to skip ignored/hidden files, and its output is parsed."""
+        import sys
+
+        nvim_dir = temp_dir / ".config/nvim"
+        nvim_dir.mkdir(parents=True)
+        bin_dir = temp_dir / "bin"
+        bin_dir.mkdir()
+        args_file = temp_dir / "args"
+        out = (
+            f"{nvim_dir}/b.lua\0" "3:second\n"
+            f"{nvim_dir}/a.lua\0" "1:first: with colon\n"
+            f"{nvim_dir}/a.lua\0" "1:same line\n"
+        )
+        fake_rg = bin_dir / "rg"
+        fake_rg.write_text(
+            f"#!{sys.executable}\n"
+            "import sys\n"
+            f"open({str(args_file)!r}, 'w').write('\\n'.join(sys.argv[1:]))\n"
+            f"sys.stdout.write({out!r})\n"
+        )
+        fake_rg.chmod(0o755)
+        monkeypatch.setenv("PATH", str(bin_dir))
+
+        index = _rg_lua_descs(nvim_dir, temp_dir)
+
+        args = args_file.read_text().split("\n")
+        assert "--no-ignore" in args
+        assert "--hidden" in args
+        assert len(index) == 2
+        assert index.get("first: with colon") == (".config/nvim/a.lua", 1)
+        assert index.get("second") == (".config/nvim/b.lua", 3)
+        assert index.get("same line") is None